@@ -2,16 +2,16 @@
 Command-line interface for BioLitMiner.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 import typer
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
+from .core.formatting import format_author_names
 from .core.logging_config import setup_logging
 from .core.version import get_version
-from .data.pubmed_client import PubMedClient
 
 app = typer.Typer(help="BioLitMiner - Biomedical Literature Mining Tool")
 console = Console()
@@ -27,12 +27,21 @@ def search(
     email: str = typer.Option(
         "user@example.com", "--email", "-e", help="Your email for PubMed API"
     ),
+    api_key: Optional[str] = typer.Option(
+        None,
+        "--api-key",
+        envvar="NCBI_API_KEY",
+        help="NCBI API key (allows 10 instead of 3 requests per second)",
+    ),
     verbose: bool = typer.Option(
         False, "--verbose", "-v", help="Enable verbose logging"
     ),
     output: Optional[str] = typer.Option(
         None, "--output", "-o", help="Save results to file (JSON)"
     ),
+    cache: Optional[str] = typer.Option(
+        None, "--cache", help="Cache searches and articles in this SQLite file"
+    ),
 ):
     """Search PubMed for biomedical articles."""
 
@@ -43,29 +52,19 @@ def search(
     console.print(f"[bold blue]Searching PubMed for:[/bold blue] {query}")
     console.print(f"[dim]Max results: {max_results}, Email: {email}[/dim]\n")
 
-    # Create PubMed client
-    client = PubMedClient(email=email)
-
-    # Search with progress indicator
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        # First get PMIDs
-        task1 = progress.add_task("Searching PubMed...", total=None)
-        pmids = client.search_pubmed(query, max_results)
-        progress.update(task1, description=f"Found {len(pmids)} PMIDs")
-
-        if not pmids:
-            progress.update(task1, description="No articles found")
-            console.print("[red]No articles found![/red]")
-            return
-
-        # Then fetch details
-        task2 = progress.add_task("Fetching article details...", total=None)
-        articles = client.fetch_article_details(pmids)
-        progress.update(task2, description="Parsing completed!")
+    # Imported here so other commands don't load requests
+    from .data.pubmed_client import PubMedClient
+
+    # Search with a transient spinner (ESearch + EFetch via the NCBI history server)
+    with (
+        PubMedClient(email=email, api_key=api_key, cache_path=cache) as client,
+        console.status("Searching PubMed and fetching article details..."),
+    ):
+        pmids, articles = client.search_and_fetch_history(query, max_results)
+
+    if not pmids:
+        console.print("[red]No articles found![/red]")
+        return
 
     if not articles:
         console.print("[red]No articles could be parsed![/red]")
@@ -79,40 +78,34 @@ def search(
             f"[yellow]Warning: Successfully parsed {parsed_count}/{total_count} articles[/yellow]"
         )
 
-    # Display results in a nice table (rest of the function stays the same)
+    # Save to file in the background while the table is rendered
+    save_future = None
+    if output:
+        from .core.serialization import dump
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        save_future = executor.submit(dump, articles, output)
+        executor.shutdown(wait=False)
+
+    # Display results in a nice table (Rich clips long titles and journals)
     table = Table(show_header=True, header_style="bold magenta")
-    table.add_column("PMID", style="cyan", width=10)
-    table.add_column("Title", style="white", width=50)
-    table.add_column("Journal", style="green", width=20)
+    table.add_column("PMID", style="cyan", width=10, no_wrap=True)
+    table.add_column(
+        "Title", style="white", width=50, overflow="ellipsis", no_wrap=True
+    )
+    table.add_column(
+        "Journal", style="green", width=20, overflow="ellipsis", no_wrap=True
+    )
     table.add_column("Authors", style="yellow", width=15)
 
     for article in articles:
-        # Truncate title if too long
-        title = (
-            article["title"][:47] + "..."
-            if len(article["title"]) > 50
-            else article["title"]
-        )
-
-        # Get first few authors
-        author_names = []
-        for author in article["authors"][:2]:  # First 2 authors
-            first_name = author["first_name"] or author["initials"]
-            author_names.append(f"{first_name} {author['last_name']}")
-
-        if len(article["authors"]) > 2:
-            author_names.append("et al.")
-
-        authors_str = ", ".join(author_names) if author_names else "No authors"
+        # First 2 authors
+        authors_str = format_author_names(article["authors"], 2) or "No authors"
 
         table.add_row(
             article["pmid"],
-            title,
-            (
-                article["journal"][:17] + "..."
-                if len(article["journal"]) > 20
-                else article["journal"]
-            ),
+            article["title"],
+            article["journal"],
             authors_str,
         )
 
@@ -121,12 +114,9 @@ def search(
         f"\n[bold green]Successfully retrieved {len(articles)} articles[/bold green]"
     )
 
-    # Save to file if requested
-    if output:
-        import json
-
-        with open(output, "w") as f:
-            json.dump(articles, f, indent=2, default=str)
+    # Wait for the file to be written, surfacing any error from the save
+    if save_future is not None:
+        save_future.result()
         console.print(f"[green]Results saved to {output}[/green]")
 
 
@@ -0,0 +1,40 @@
+"""
+Display formatting helpers for BioLitMiner.
+"""
+
+from typing import Dict, List
+
+
+def format_author(author: Dict[str, str]) -> str:
+    """
+    Format an author dictionary as "First Last".
+
+    Initials are used when there is no first name, and collective names
+    (stored as last_name only) are returned as-is.
+
+    Args:
+        author: Author dictionary with last_name, first_name and initials
+
+    Returns:
+        Formatted author name, or "" if the author has no name
+    """
+    first_name = author.get("first_name") or author.get("initials") or ""
+    last_name = author.get("last_name") or ""
+    return f"{first_name} {last_name}".strip()
+
+
+def format_author_names(authors: List[Dict[str, str]], max_authors: int) -> str:
+    """
+    Format the first few authors as a comma-separated string.
+
+    Args:
+        authors: List of author dictionaries
+        max_authors: Maximum number of authors to include before "et al."
+
+    Returns:
+        Comma-separated author names, ending with "et al." if truncated
+    """
+    names = [name for name in map(format_author, authors[:max_authors]) if name]
+    if len(authors) > max_authors:
+        names.append("et al.")
+    return ", ".join(names)
@@ -2,10 +2,52 @@
 Logging configuration for BioLitMiner.
 """
 
+import atexit
 import logging
 import logging.handlers
+import queue
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
+
+# Log file from the last setup_logging() call and the handlers it created
+_configured = False
+_current_log_file: Optional[str] = None
+_current_handlers: List[logging.Handler] = []
+
+# Console handler, kept once created and silenced while console logging is off
+_console_handler: Optional[logging.StreamHandler] = None
+_CONSOLE_OFF = logging.CRITICAL + 1
+
+# Formatter shared by the console and file handlers
+_FORMATTER = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+# Background listener that writes queued records to the log file
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_queue_listener() -> None:
+    """Flush queued records and stop the file logging thread, if running."""
+    global _queue_listener
+
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
+def _create_console_handler(level: int) -> logging.StreamHandler:
+    """Create a console handler at the given level."""
+    handler = logging.StreamHandler()
+    handler.setLevel(level)
+    handler.setFormatter(_FORMATTER)
+    return handler
 
 
 def setup_logging(
@@ -14,44 +56,85 @@ def setup_logging(
     """
     Set up logging configuration for BioLitMiner.
 
+    File output goes through a queue and is written by a background thread, so
+    logging calls don't block on disk I/O. Repeated calls with the same log_file
+    only update the logging level instead of rebuilding the handlers; turning
+    console logging off silences the console handler rather than removing it.
+
     Args:
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Path to log file (optional)
         log_to_console: Whether to log to console
     """
+    global _configured, _current_log_file, _current_handlers, _console_handler
+    global _queue_listener
+
+    log_level = getattr(logging, level.upper())
+    console_level = log_level if log_to_console else _CONSOLE_OFF
+    logger = logging.getLogger()
+
+    # Handlers are already in place, only the levels need to change
+    if (
+        _configured
+        and log_file == _current_log_file
+        and logger.handlers == _current_handlers
+    ):
+        logger.setLevel(log_level)
+        for handler in _current_handlers:
+            handler.setLevel(log_level)
+        if _queue_listener is not None:
+            for handler in _queue_listener.handlers:
+                handler.setLevel(log_level)
+
+        if _console_handler is not None:
+            _console_handler.setLevel(console_level)
+        elif log_to_console:
+            _console_handler = _create_console_handler(log_level)
+            logger.addHandler(_console_handler)
+            _current_handlers = list(logger.handlers)
+        return
+
     # Create logs directory if it doesn't exist
     if log_file:
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
 
     # Configure root logger
-    logger = logging.getLogger()
-    logger.setLevel(getattr(logging, level.upper()))
+    logger.setLevel(log_level)
 
-    # Clear any existing handlers
+    # Clear any existing handlers, closing the ones we created before
     logger.handlers.clear()
-
-    # Create formatter
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+    for handler in _current_handlers:
+        handler.close()
+    _console_handler = None
+    _stop_queue_listener()
 
     # Add console handler
     if log_to_console:
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(getattr(logging, level.upper()))
-        console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        _console_handler = _create_console_handler(log_level)
+        logger.addHandler(_console_handler)
 
-    # Add file handler if specified
+    # Add file handler if specified, written from a background thread
     if log_file:
         file_handler = logging.handlers.RotatingFileHandler(
             log_file, maxBytes=10 * 1024 * 1024, backupCount=5  # 10MB
         )
-        file_handler.setLevel(getattr(logging, level.upper()))
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        file_handler.setLevel(log_level)
+        file_handler.setFormatter(_FORMATTER)
+
+        log_queue = queue.SimpleQueue()
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setLevel(log_level)
+        logger.addHandler(queue_handler)
+
+        _queue_listener = logging.handlers.QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        _queue_listener.start()
+
+    _configured = True
+    _current_log_file = log_file
+    _current_handlers = list(logger.handlers)
 
     # Set levels for external libraries to reduce noise
     logging.getLogger("requests").setLevel(logging.WARNING)
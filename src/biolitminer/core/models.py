@@ -2,32 +2,33 @@
 Simple data models for BioLitMiner.
 """
 
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Optional
 
 
+@dataclass(slots=True)
 class Author:
     """Simple author model."""
 
-    def __init__(self, last_name: str, first_name: str, initials: str = ""):
-        self.last_name = last_name
-        self.first_name = first_name
-        self.initials = initials
+    last_name: str
+    first_name: str
+    initials: str = ""
 
     def __str__(self):
         return f"{self.first_name} {self.last_name}"
 
 
+@dataclass(slots=True)
 class Article:
     """Simple article model."""
 
-    def __init__(self, pmid: str, title: str, abstract: str = ""):
-        self.pmid = pmid
-        self.title = title
-        self.abstract = abstract
-        self.authors: List[Author] = []
-        self.publication_date: Optional[datetime] = None
-        self.journal: str = ""
+    pmid: str
+    title: str
+    abstract: str = ""
+    authors: List[Author] = field(default_factory=list)
+    publication_date: Optional[datetime] = None
+    journal: str = ""
 
     def add_author(self, author: Author):
         """Add an author to the article."""
@@ -0,0 +1,74 @@
+"""
+JSON serialization helpers for BioLitMiner.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to indented, UTF-8 encoded JSON.
+
+    Uses orjson when it is installed and falls back to the standard library
+    otherwise. Values that are not natively serializable are converted with str().
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(obj, indent=2, default=str).encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Deserialize a JSON document.
+
+    Uses orjson when it is installed and falls back to the standard library
+    otherwise.
+
+    Args:
+        data: JSON document as bytes or str
+
+    Returns:
+        Deserialized object
+
+    Raises:
+        ValueError: If the document isn't valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dump(obj: Any, path: Union[str, Path]) -> None:
+    """
+    Serialize an object as indented JSON directly to a file.
+
+    With orjson the encoded bytes are written in one call; the standard library
+    fallback streams chunks to the file instead of building the whole string.
+
+    Args:
+        obj: Object to serialize
+        path: Output file path
+    """
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(dumps(obj))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(obj, f, indent=2, default=str)
@@ -2,36 +2,53 @@
 Version management for BioLitMiner.
 """
 
+import sys
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
-import toml
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
 
 
+def _find_pyproject() -> Optional[Path]:
+    """
+    Find pyproject.toml by walking up the directory tree from this file.
+
+    Returns:
+        Path to pyproject.toml or None if it can't be found
+    """
+    # Handle different working directories
+    current_dir = Path(__file__).parent
+    for parent in [current_dir] + list(current_dir.parents):
+        potential_path = parent / "pyproject.toml"
+        if potential_path.exists():
+            return potential_path
+    return None
+
+
+_PYPROJECT_PATH = _find_pyproject()
+
+
+@lru_cache(maxsize=1)
 def get_version() -> str:
     """
     Get the current version from pyproject.toml.
 
+    The file is read once per process; later calls return the cached value.
+
     Returns:
         Version string (e.g., "0.2.1")
     """
     try:
-        # Find pyproject.toml (handle different working directories)
-        current_dir = Path(__file__).parent
-        pyproject_path = None
-
-        # Look for pyproject.toml going up the directory tree
-        for parent in [current_dir] + list(current_dir.parents):
-            potential_path = parent / "pyproject.toml"
-            if potential_path.exists():
-                pyproject_path = potential_path
-                break
-
-        if pyproject_path is None:
+        if _PYPROJECT_PATH is None:
             return "unknown"
 
         # Read and parse pyproject.toml
-        with open(pyproject_path, "r") as f:
-            pyproject_data = toml.load(f)
+        with open(_PYPROJECT_PATH, "rb") as f:
+            pyproject_data = tomllib.load(f)
 
         return pyproject_data["project"]["version"]
 
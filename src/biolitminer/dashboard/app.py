@@ -2,8 +2,10 @@
 BioLitMiner Streamlit Dashboard - Main Application
 """
 
+import os
 import sys
 from pathlib import Path
+from typing import List, Tuple
 
 import streamlit as st
 
@@ -12,7 +14,6 @@ src_path = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(src_path))
 
 from biolitminer.core.logging_config import setup_logging
-from biolitminer.dashboard.components.export import show_export_options
 from biolitminer.dashboard.components.results import (
     display_results,
     display_summary_stats,
@@ -36,6 +37,58 @@ st.set_page_config(
 setup_logging(level="WARNING", log_to_console=False)
 
 
+@st.cache_resource
+def get_pubmed_client(email: str) -> PubMedClient:
+    """Get a PubMed client shared across reruns for the given email."""
+    # An NCBI API key from the environment raises the rate limit
+    return PubMedClient(email=email, api_key=os.environ.get("NCBI_API_KEY"))
+
+
+class NoArticlesFound(Exception):
+    """Raised when a search returns no PMIDs."""
+
+
+class IncompleteResults(Exception):
+    """Raised when details couldn't be fetched for every PMID a search returned."""
+
+    def __init__(self, pmids: List[str], articles: List):
+        super().__init__(f"Fetched {len(articles)} of {len(pmids)} articles")
+        self.pmids = pmids
+        self.articles = articles
+
+
+@st.cache_data(ttl=3600, max_entries=128, show_spinner=False)
+def run_search(query: str, max_results: int, email: str) -> Tuple[List[str], List]:
+    """
+    Search PubMed and fetch article details, caching results for an hour.
+
+    The client reports network errors as empty results, so empty or partial
+    results raise instead of returning; Streamlit doesn't cache exceptions, so
+    the next search for the query tries NCBI again.
+
+    Args:
+        query: Search query string
+        max_results: Maximum number of results to return
+        email: Email for PubMed API
+
+    Returns:
+        Tuple of (PMIDs, article dictionaries)
+
+    Raises:
+        NoArticlesFound: If the search returned no PMIDs
+        IncompleteResults: If details are missing for any of the PMIDs
+    """
+    client = get_pubmed_client(email)
+    pmids = client.search_pubmed(query, max_results)
+    if not pmids:
+        raise NoArticlesFound(query)
+
+    articles = client.fetch_article_details(pmids)
+    if len(articles) < len(pmids):
+        raise IncompleteResults(pmids, articles)
+    return pmids, articles
+
+
 def main():
     """Main dashboard application."""
     # Header
@@ -76,22 +129,18 @@ def perform_search(query: str, config: dict):
         if config["verbose_logging"]:
             setup_logging(level="DEBUG", log_to_console=True)
 
-        # Initialize and search
-        status_text.text("🔧 Initializing PubMed client...")
-        client = PubMedClient(email=config["email"])
-        progress_bar.progress(20)
-
+        # Search and fetch details (cached for repeated queries)
         status_text.text("🔍 Searching PubMed...")
-        pmids = client.search_pubmed(query, config["max_results"])
-        progress_bar.progress(50)
-
-        if not pmids:
+        progress_bar.progress(20)
+        try:
+            pmids, articles = run_search(query, config["max_results"], config["email"])
+        except NoArticlesFound:
+            progress_bar.progress(100)
+            status_text.text("✅ Search completed!")
             st.warning("No articles found. Try different keywords.")
             return
-
-        status_text.text(f"📥 Fetching details for {len(pmids)} articles...")
-        articles = client.fetch_article_details(pmids)
-        progress_bar.progress(90)
+        except IncompleteResults as e:
+            pmids, articles = e.pmids, e.articles
 
         progress_bar.progress(100)
         status_text.text("✅ Search completed!")
@@ -100,11 +149,19 @@ def perform_search(query: str, config: dict):
             st.error("Found articles but couldn't parse details.")
             return
 
+        if len(articles) < len(pmids):
+            st.warning(
+                f"Couldn't fetch details for {len(pmids) - len(articles)} "
+                f"of {len(pmids)} articles."
+            )
+
         # Display results
         display_summary_stats(articles, len(pmids))
         display_results(articles, config["show_abstracts"])
 
-        # Store results and show export options
+        # Store results and show export options (loaded only once a search succeeds)
+        from biolitminer.dashboard.components.export import show_export_options
+
         st.session_state.last_results = articles
         st.session_state.last_query = query
         show_export_options(articles, query)
@@ -2,12 +2,14 @@
 Simple export functionality for BioLitMiner dashboard.
 """
 
-import json
 from datetime import datetime
 from typing import Any, Dict, List
 
 import streamlit as st
 
+from biolitminer.core.serialization import dumps
+from biolitminer.dashboard.utils.stats import summarize_articles
+
 
 def show_export_options(articles: List[Dict[str, Any]], query: str):
     """Show basic export options for search results."""
@@ -28,20 +30,19 @@ def show_export_options(articles: List[Dict[str, Any]], query: str):
 
     with col2:
         # Show basic stats
-        st.info(
-            f"📊 Found {len(articles)} articles from {len(set(a.get('journal', 'Unknown') for a in articles))} journals"
-        )
+        unique_journals, _ = summarize_articles(articles)
+        st.info(f"📊 Found {len(articles)} articles from {unique_journals} journals")
 
 
-def create_json_export(articles: List[Dict[str, Any]], query: str) -> str:
-    """Create simple JSON export."""
+def create_json_export(articles: List[Dict[str, Any]], query: str) -> bytes:
+    """Create simple JSON export as UTF-8 bytes."""
     export_data = {
         "search_query": query,
         "export_date": datetime.now().isoformat(),
         "total_articles": len(articles),
         "articles": articles,
     }
-    return json.dumps(export_data, indent=2, default=str)
+    return dumps(export_data)
 
 
 def generate_filename(file_type: str) -> str:
@@ -2,14 +2,19 @@
 Results display component for BioLitMiner dashboard.
 """
 
-import pandas as pd
+from collections import Counter
+
 import streamlit as st
 
+from biolitminer.core.formatting import format_author_names
+from biolitminer.dashboard.utils.stats import summarize_articles
+
 
 def display_summary_stats(articles: list, total_pmids: int):
     """Display summary statistics about the search results."""
     st.subheader("📊 Summary Statistics")
 
+    unique_journals, total_authors = summarize_articles(articles)
     col1, col2, col3, col4 = st.columns(4)
 
     with col1:
@@ -19,11 +24,9 @@ def display_summary_stats(articles: list, total_pmids: int):
         st.metric("✅ Successfully Parsed", f"{len(articles)}/{total_pmids}")
 
     with col3:
-        journals = set(article.get("journal", "Unknown") for article in articles)
-        st.metric("📚 Unique Journals", len(journals))
+        st.metric("📚 Unique Journals", unique_journals)
 
     with col4:
-        total_authors = sum(len(article.get("authors", [])) for article in articles)
         st.metric("👥 Total Authors", total_authors)
 
 
@@ -31,49 +34,37 @@ def display_results(articles: list, show_abstracts: bool):
     """Display search results in a nice format."""
     st.subheader("📄 Articles")
 
+    # Streamlit re-renders every article on each rerun, so avoid repeated lookups
+    write = st.write
+
     for i, article in enumerate(articles, 1):
-        with st.expander(
-            f"**{i}. {article.get('title', 'No title')}**", expanded=False
-        ):
+        get = article.get
+        with st.expander(f"**{i}. {get('title', 'No title')}**", expanded=False):
             # Article metadata
             col1, col2 = st.columns([2, 1])
 
             with col1:
-                st.write(f"**PMID:** {article.get('pmid', 'Unknown')}")
-                st.write(f"**Journal:** {article.get('journal', 'Unknown')}")
+                write(f"**PMID:** {get('pmid', 'Unknown')}")
+                write(f"**Journal:** {get('journal', 'Unknown')}")
 
                 # Authors
-                authors = article.get("authors", [])
+                authors = get("authors", [])
                 if authors:
-                    author_names = []
-                    for author in authors[:5]:
-                        first_name = author.get("first_name", "") or author.get(
-                            "initials", ""
-                        )
-                        last_name = author.get("last_name", "")
-                        if first_name and last_name:
-                            author_names.append(f"{first_name} {last_name}")
-                        elif last_name:
-                            author_names.append(last_name)
-
-                    if len(authors) > 5:
-                        author_names.append("et al.")
-
-                    st.write(f"**Authors:** {', '.join(author_names)}")
+                    write(f"**Authors:** {format_author_names(authors, 5)}")
 
             with col2:
-                pub_date = article.get("publication_date")
+                pub_date = get("publication_date")
                 if pub_date:
-                    st.write(f"**Year:** {pub_date}")
+                    write(f"**Year:** {pub_date}")
 
             # Abstract
             if show_abstracts:
-                abstract = article.get("abstract", "")
+                abstract = get("abstract", "")
                 if abstract:
-                    st.write("**Abstract:**")
-                    st.write(abstract)
+                    write("**Abstract:**")
+                    write(abstract)
                 else:
-                    st.write("*No abstract available*")
+                    write("*No abstract available*")
 
 
 def show_summary_report(articles: list, query: str):
@@ -87,9 +78,10 @@ def show_summary_report(articles: list, query: str):
     st.write(f"**Total Articles:** {len(articles)}")
 
     if articles:
-        journals = [article.get("journal", "Unknown") for article in articles]
-        journal_counts = pd.Series(journals).value_counts()
+        journal_counts = Counter(
+            article.get("journal", "Unknown") for article in articles
+        )
 
         st.write("**Top Journals:**")
-        for journal, count in journal_counts.head(5).items():
+        for journal, count in journal_counts.most_common(5):
             st.write(f"- {journal}: {count} articles")
@@ -0,0 +1,37 @@
+"""
+Article statistics helpers for BioLitMiner dashboard.
+"""
+
+from typing import Any, Dict, List, Tuple
+
+import streamlit as st
+
+
+def summarize_articles(articles: List[Dict[str, Any]]) -> Tuple[int, int]:
+    """
+    Get summary statistics for a list of articles.
+
+    Results are cached per set of PMIDs, so the summary cards and the export
+    panel share a single pass over the articles.
+
+    Args:
+        articles: List of article dictionaries
+
+    Returns:
+        Tuple of (unique journal count, total author count)
+    """
+    pmids = tuple(article.get("pmid", "") for article in articles)
+    return _summarize(pmids, articles)
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _summarize(
+    pmids: Tuple[str, ...], _articles: List[Dict[str, Any]]
+) -> Tuple[int, int]:
+    """Compute summary statistics in one pass (keyed on PMIDs only)."""
+    journals = set()
+    total_authors = 0
+    for article in _articles:
+        journals.add(article.get("journal", "Unknown"))
+        total_authors += len(article.get("authors", ()))
+    return len(journals), total_authors
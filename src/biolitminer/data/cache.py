@@ -0,0 +1,215 @@
+"""
+On-disk cache for PubMed search results and article details.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from ..core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Article records for a PMID rarely change, search results change as PubMed grows
+DEFAULT_ARTICLE_EXPIRE_AFTER = 30 * 24 * 60 * 60  # 30 days
+DEFAULT_SEARCH_EXPIRE_AFTER = 24 * 60 * 60  # 1 day
+
+# Maximum number of articles kept before the least recently used are evicted
+DEFAULT_MAX_ARTICLES = 50_000
+
+# Number of recent searches also kept in memory, so repeats skip SQLite entirely
+DEFAULT_MEMORY_SEARCHES = 256
+
+# SQLite limits the number of host parameters in a single statement
+_SQL_BATCH_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    pmid TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS articles_accessed_at ON articles (accessed_at);
+CREATE TABLE IF NOT EXISTS searches (
+    query TEXT NOT NULL,
+    max_results INTEGER NOT NULL,
+    pmids TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (query, max_results)
+);
+"""
+
+
+class PubMedCache:
+    """SQLite-backed cache of article details keyed by PMID and of search results."""
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        article_expire_after: float = DEFAULT_ARTICLE_EXPIRE_AFTER,
+        search_expire_after: float = DEFAULT_SEARCH_EXPIRE_AFTER,
+        max_articles: int = DEFAULT_MAX_ARTICLES,
+        memory_searches: int = DEFAULT_MEMORY_SEARCHES,
+    ):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: Path to the SQLite database file (":memory:" for a cache that
+                only lasts as long as the process)
+            article_expire_after: Seconds before a cached article is refetched
+            search_expire_after: Seconds before a cached search is rerun
+            max_articles: Maximum number of cached articles
+            memory_searches: Number of recent searches also kept in memory
+        """
+        self.path = Path(path)
+        self.article_expire_after = article_expire_after
+        self.search_expire_after = search_expire_after
+        self.max_articles = max_articles
+        self.memory_searches = memory_searches
+
+        # (query, max_results) -> (fetched_at, PMIDs), least recently used first
+        self._recent_searches = OrderedDict()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        # The connection is shared between threads, so all access goes through a lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+
+        logger.debug("Opened PubMed cache at %s", self.path)
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _normalize_query(query: str) -> str:
+        """Normalize a query so trivially different spellings share an entry."""
+        return " ".join(query.split())
+
+    def get_search(self, query: str, max_results: int) -> Optional[List[str]]:
+        """
+        Look up the PMIDs previously returned for a search.
+
+        Args:
+            query: Search query string
+            max_results: Maximum number of results requested
+
+        Returns:
+            List of PMIDs or None if the search isn't cached or has expired
+        """
+        key = (self._normalize_query(query), max_results)
+        cutoff = time.time() - self.search_expire_after
+        with self._lock:
+            recent = self._recent_searches.get(key)
+            if recent is not None and recent[0] >= cutoff:
+                self._recent_searches.move_to_end(key)
+                return list(recent[1])
+
+            row = self._conn.execute(
+                "SELECT pmids, fetched_at FROM searches"
+                " WHERE query = ? AND max_results = ? AND fetched_at >= ?",
+                (*key, cutoff),
+            ).fetchone()
+            if row is None:
+                return None
+
+            pmids = json.loads(row[0])
+            self._remember_search(key, row[1], pmids)
+        return pmids
+
+    def set_search(self, query: str, max_results: int, pmids: List[str]):
+        """
+        Store the PMIDs returned for a search.
+
+        Args:
+            query: Search query string
+            max_results: Maximum number of results requested
+            pmids: PMIDs returned by the search
+        """
+        key = (self._normalize_query(query), max_results)
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO searches VALUES (?, ?, ?, ?)",
+                (*key, json.dumps(pmids), now),
+            )
+            self._remember_search(key, now, pmids)
+
+    def _remember_search(
+        self, key: Tuple[str, int], fetched_at: float, pmids: List[str]
+    ):
+        """Keep a search in memory, evicting the least recently used (lock held)."""
+        if self.memory_searches <= 0:
+            return
+        self._recent_searches[key] = (fetched_at, tuple(pmids))
+        self._recent_searches.move_to_end(key)
+        while len(self._recent_searches) > self.memory_searches:
+            self._recent_searches.popitem(last=False)
+
+    def get_articles(self, pmids: List[str]) -> Dict[str, dict]:
+        """
+        Look up cached article details.
+
+        Args:
+            pmids: PMIDs to look up
+
+        Returns:
+            Dictionary mapping each cached, unexpired PMID to its article details
+        """
+        now = time.time()
+        cutoff = now - self.article_expire_after
+        found = {}
+        with self._lock, self._conn:
+            for start in range(0, len(pmids), _SQL_BATCH_SIZE):
+                chunk = pmids[start : start + _SQL_BATCH_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT pmid, data FROM articles"
+                    f" WHERE pmid IN ({placeholders}) AND fetched_at >= ?",
+                    (*chunk, cutoff),
+                ).fetchall()
+                found.update((pmid, json.loads(data)) for pmid, data in rows)
+
+            # Mark hits as recently used so they survive eviction
+            if found:
+                self._conn.executemany(
+                    "UPDATE articles SET accessed_at = ? WHERE pmid = ?",
+                    [(now, pmid) for pmid in found],
+                )
+        return found
+
+    def set_articles(self, articles: List[dict]):
+        """
+        Store article details, evicting the least recently used beyond max_articles.
+
+        Args:
+            articles: Article dictionaries as returned by PubMedClient
+        """
+        if not articles:
+            return
+
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO articles VALUES (?, ?, ?, ?)",
+                [
+                    (article["pmid"], json.dumps(article), now, now)
+                    for article in articles
+                ],
+            )
+            self._conn.execute(
+                "DELETE FROM articles WHERE pmid IN ("
+                " SELECT pmid FROM articles ORDER BY accessed_at DESC LIMIT -1 OFFSET ?"
+                ")",
+                (self.max_articles,),
+            )
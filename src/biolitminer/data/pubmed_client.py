@@ -2,39 +2,261 @@
 Simple PubMed client for searching biomedical literature.
 """
 
+import logging
+import random
+import threading
 import time
-import xml.etree.ElementTree as ET
-from typing import List
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import requests
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ..core.logging_config import get_logger
+from ..core.serialization import loads
+from ..core.version import get_version
+from .cache import PubMedCache
 
 logger = get_logger(__name__)
 
+# NCBI recommends at most 200 IDs per EFetch request
+EFETCH_BATCH_SIZE = 200
+
+# Maximum number of EFetch batches in flight at once
+MAX_CONCURRENT_REQUESTS = 3
+
+# Tool name sent to NCBI with each request, alongside the contact email
+TOOL_NAME = "biolitminer"
+
+# Minimum seconds between requests: NCBI allows 3 requests/s, or 10 with an API key
+MIN_DELAY = 0.34
+MIN_DELAY_WITH_API_KEY = 0.1
+
+# Bytes read from the network at a time while parsing streamed responses
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# (connect, read) timeouts in seconds for E-utilities requests
+REQUEST_TIMEOUT = (5, 30)
+
+# Retries for rate-limited (429) and server error responses
+MAX_ATTEMPTS = 5
+RETRY_BACKOFF_BASE = 0.5  # seconds, doubled on each attempt (plus jitter)
+MAX_RETRY_DELAY = 60  # seconds, caps the server's Retry-After
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Retries for failed connections, handled by urllib3 below the status-code retries.
+# Nothing has reached the server yet, so these are safe even for POST.
+CONNECT_RETRIES = Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.5)
+
+# Author child elements and the keys they are stored under while parsing
+_AUTHOR_FIELDS = {
+    "LastName": "last_name",
+    "ForeName": "first_name",
+    "Initials": "initials",
+    "CollectiveName": "collective_name",
+}
+
+# Starting point for each parsed author (copied, then filled in)
+_AUTHOR_TEMPLATE = {"last_name": "", "first_name": "", "initials": ""}
+
+# Journal name elements, in order of preference
+_JOURNAL_TAGS = ("Title", "ISOAbbreviation", "MedlineTA")
+
+# Every element tag _parse_article_xml looks at
+_FIELD_TAGS = (
+    "PMID",
+    "ArticleTitle",
+    "AbstractText",
+    "Author",
+    "Year",
+    *_AUTHOR_FIELDS,
+    *_JOURNAL_TAGS,
+)
+
+# Full text content of an element, including inline markup
+_XP_STRING = etree.XPath("string()")
+
+
+def _retry_after(response: requests.Response) -> Optional[float]:
+    """
+    Get the delay requested by a response's Retry-After header.
+
+    Args:
+        response: HTTP response
+
+    Returns:
+        Delay in seconds (capped at MAX_RETRY_DELAY) or None if the header is
+        missing or not a number of seconds
+    """
+    try:
+        delay = float(response.headers["Retry-After"])
+    except (KeyError, ValueError):
+        return None
+    return min(max(delay, 0.0), MAX_RETRY_DELAY)
+
 
 class PubMedClient:
     """Simple client for searching PubMed with rate limiting."""
 
-    def __init__(self, email: str = "user@example.com"):
-        """Initialize the PubMed client."""
+    # NCBI's rate limit applies per user, so it is shared by all clients in the process
+    _rate_limit_lock = threading.Lock()
+    _last_request_time = 0.0
+
+    def __init__(
+        self,
+        email: str = "user@example.com",
+        api_key: Optional[str] = None,
+        cache_path: Optional[Union[str, Path]] = None,
+        max_attempts: int = MAX_ATTEMPTS,
+    ):
+        """
+        Initialize the PubMed client.
+
+        Args:
+            email: Contact email sent to NCBI with each request
+            api_key: NCBI API key, which raises the rate limit from 3 to 10
+                requests per second
+            cache_path: SQLite file for caching searches and articles on disk
+                (":memory:" to cache for this process only, no caching if None)
+            max_attempts: Attempts per request before giving up on 429/5xx responses
+
+        Raises:
+            ValueError: If max_attempts is less than 1
+        """
+        if max_attempts < 1:
+            raise ValueError(f"max_attempts must be at least 1, got {max_attempts}")
+
         self.email = email
+        self.api_key = api_key
         self.base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
-        self.last_request_time = 0
-        self.min_delay = 0.5  # Minimum 0.5 seconds between requests
-        logger.info(f"Initialized PubMed client for {email}")
+        self.min_delay = MIN_DELAY_WITH_API_KEY if api_key else MIN_DELAY
+        self.max_attempts = max_attempts
+
+        # URLs and the parameters sent with every request only depend on the above
+        self._search_url = f"{self.base_url}/esearch.fcgi"
+        self._fetch_url = f"{self.base_url}/efetch.fcgi"
+        common_params = {"db": "pubmed", "tool": TOOL_NAME, "email": email}
+        if api_key:
+            common_params["api_key"] = api_key
+        self._base_search_params = {**common_params, "retmode": "json"}
+        self._base_fetch_params = {
+            **common_params,
+            "retmode": "xml",
+            "rettype": "abstract",
+        }
+
+        # Reuse connections to NCBI across requests (HTTP keep-alive)
+        self.session = requests.Session()
+        self.session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=4, pool_maxsize=16, max_retries=CONNECT_RETRIES
+            ),
+        )
+        self.session.headers.update(
+            {
+                "User-Agent": f"biolitminer/{get_version()}",
+                "Accept-Encoding": "gzip, deflate",
+            }
+        )
+
+        self.cache = PubMedCache(cache_path) if cache_path is not None else None
+
+        logger.info("Initialized PubMed client for %s", email)
+
+    def close(self):
+        """Close the underlying HTTP session and the cache, if any."""
+        self.session.close()
+        if self.cache is not None:
+            self.cache.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def _rate_limit(self):
-        """Apply rate limiting between requests."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
+        """
+        Apply rate limiting between requests.
+
+        Requests from every client instance and thread in the process are spaced
+        at least min_delay apart.
+        """
+        cls = PubMedClient
+        with cls._rate_limit_lock:
+            time_since_last = time.monotonic() - cls._last_request_time
+
+            if time_since_last < self.min_delay:
+                sleep_time = self.min_delay - time_since_last
+                logger.debug("Rate limiting: waiting %.2f seconds", sleep_time)
+                time.sleep(sleep_time)
+
+            cls._last_request_time = time.monotonic()
 
-        if time_since_last < self.min_delay:
-            sleep_time = self.min_delay - time_since_last
-            logger.debug(f"Rate limiting: waiting {sleep_time:.2f} seconds")
-            time.sleep(sleep_time)
+    def _request_with_retry(
+        self, url: str, params: dict, stream: bool = False
+    ) -> requests.Response:
+        """
+        Make a rate-limited POST request, retrying 429 and 5xx responses.
+
+        Parameters are sent as a form body rather than in the URL, so long PMID
+        lists and queries don't run into URL length limits.
 
-        self.last_request_time = time.time()
+        Retries wait for the server's Retry-After if given, otherwise back off
+        exponentially (RETRY_BACKOFF_BASE * 2**attempt plus jitter).
+
+        Args:
+            url: Request URL
+            params: Request parameters
+            stream: Whether to stream the response body
+
+        Returns:
+            The successful response
+
+        Raises:
+            requests.RequestException: If the request fails or still returns an
+                error status after max_attempts attempts
+        """
+        for attempt in range(self.max_attempts):
+            self._rate_limit()
+
+            logger.debug("Making request to: %s", url)
+            response = self.session.post(
+                url, data=params, timeout=REQUEST_TIMEOUT, stream=stream
+            )
+            if (
+                response.status_code not in RETRY_STATUS_CODES
+                or attempt == self.max_attempts - 1
+            ):
+                try:
+                    response.raise_for_status()
+                except requests.HTTPError:
+                    # Release the pooled connection held by a streamed response
+                    response.close()
+                    raise
+                return response
+
+            delay = _retry_after(response)
+            if delay is None:
+                delay = RETRY_BACKOFF_BASE * 2**attempt + random.uniform(
+                    0, RETRY_BACKOFF_BASE
+                )
+            response.close()
+
+            logger.warning(
+                "Request failed with HTTP %s, retrying in %.1f seconds (attempt %s/%s)",
+                response.status_code,
+                delay,
+                attempt + 1,
+                self.max_attempts,
+            )
+            time.sleep(delay)
 
     def search_pubmed(self, query: str, max_results: int = 10) -> List[str]:
         """
@@ -47,124 +269,328 @@ class PubMedClient:
         Returns:
             List of PMIDs as strings
         """
-        logger.info(f"Searching PubMed for: '{query}' (max_results={max_results})")
+        logger.info("Searching PubMed for: '%s' (max_results=%s)", query, max_results)
+
+        if self.cache is not None:
+            pmids = self.cache.get_search(query, max_results)
+            if pmids is not None:
+                logger.info("Found %s articles (cached)", len(pmids))
+                return pmids
+
+        result = self._esearch(query, max_results)
+        if result is None:
+            return []
+
+        # Extract PMIDs
+        pmids = result.get("idlist", [])
+
+        if self.cache is not None:
+            self.cache.set_search(query, max_results, pmids)
+
+        logger.info("Found %s articles", len(pmids))
+        logger.debug("PMIDs: %s", pmids)
+        return pmids
+
+    def search_many(
+        self, queries: List[str], max_results: int = 10
+    ) -> Dict[str, List[str]]:
+        """
+        Run several independent PubMed searches concurrently.
+
+        Up to MAX_CONCURRENT_REQUESTS searches are in flight at once; the shared
+        rate limiter still spaces out when each request starts.
+
+        Args:
+            queries: Search query strings
+            max_results: Maximum number of results to return per query
+
+        Returns:
+            Dictionary mapping each query to its list of PMIDs, in query order
+        """
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            results = executor.map(
+                lambda query: self.search_pubmed(query, max_results), queries
+            )
+            return dict(zip(queries, results))
+
+    def _esearch(
+        self, query: str, max_results: int, use_history: bool = False
+    ) -> Optional[dict]:
+        """
+        Run an ESearch request and return the parsed JSON result.
 
-        # Apply rate limiting
-        self._rate_limit()
+        Only the PMIDs and history keys are needed from ESearch, so it is asked for
+        JSON, which decodes much faster than XML parses.
 
-        # Build the search URL
-        search_url = f"{self.base_url}/esearch.fcgi"
+        Args:
+            query: Search query string
+            max_results: Maximum number of PMIDs to return
+            use_history: Whether to store the results on the NCBI history server
 
+        Returns:
+            The "esearchresult" object of the response (with "idlist" and, for
+            history searches, "webenv"/"querykey") or None if the request failed
+        """
         # Parameters for the search
-        params = {
-            "db": "pubmed",
-            "term": query,
-            "retmax": max_results,
-            "retmode": "xml",
-            "email": self.email,
-        }
+        params = {**self._base_search_params, "term": query, "retmax": max_results}
+        if use_history:
+            params["usehistory"] = "y"
 
         try:
             # Make the request
-            logger.debug(f"Making request to: {search_url}")
-            response = requests.get(search_url, params=params)
-            response.raise_for_status()
-
-            # Parse the XML response
-            root = ET.fromstring(response.text)
-
-            # Extract PMIDs
-            pmids = []
-            for id_elem in root.findall(".//Id"):
-                pmids.append(id_elem.text)
+            response = self._request_with_retry(self._search_url, params)
 
-            logger.info(f"Found {len(pmids)} articles")
-            logger.debug(f"PMIDs: {pmids}")
-            return pmids
+            # Parse the JSON response
+            result = loads(response.content)["esearchresult"]
+            if "ERROR" in result:
+                logger.warning("PubMed search failed: %s", result["ERROR"])
+                return None
+            return result
 
         except requests.RequestException as e:
-            if "429" in str(e):
-                logger.warning("Rate limit exceeded. Waiting 10 seconds...")
-                time.sleep(10)
-                return self.search_pubmed(query, max_results)  # Retry once
-            else:
-                logger.error(f"Error searching PubMed: {e}")
-                return []
-        except ET.ParseError as e:
-            logger.error(f"Error parsing XML response: {e}")
-            return []
+            logger.error("Error searching PubMed: %s", e)
+            return None
+        except (ValueError, KeyError, TypeError) as e:
+            logger.error("Error parsing JSON response: %s", e)
+            return None
         except Exception as e:
-            logger.error(f"Unexpected error: {e}")
-            return []
+            logger.error("Unexpected error: %s", e)
+            return None
 
     def fetch_article_details(self, pmids: List[str]) -> List:
         """
         Fetch detailed article information for given PMIDs.
 
+        PMIDs are requested in batches of at most EFETCH_BATCH_SIZE per EFetch call.
+        With a cache, only PMIDs that aren't already cached are requested.
+
         Args:
             pmids: List of PubMed IDs
 
         Returns:
-            List of dictionaries containing article details
+            List of dictionaries containing article details, in PMID order
+        """
+        articles = list(self.iter_article_details(pmids))
+
+        if self.cache is not None and len(articles) > 1:
+            # Cached articles come first, restore the order the PMIDs were requested
+            order = {pmid: index for index, pmid in enumerate(pmids)}
+            articles.sort(key=lambda article: order.get(article["pmid"], len(order)))
+
+        logger.info("Successfully parsed %s articles", len(articles))
+        return articles
+
+    def iter_article_details(self, pmids: List[str]) -> Iterator[dict]:
+        """
+        Fetch detailed article information for given PMIDs, one article at a time.
+
+        Articles are yielded as soon as they are parsed: with a single EFetch batch
+        that is while the response is still downloading, with several batches it is
+        a batch at a time. Cached articles are yielded first.
+
+        Args:
+            pmids: List of PubMed IDs
+
+        Yields:
+            Dictionary containing article details
         """
         if not pmids:
             logger.warning("No PMIDs provided for fetching details")
-            return []
+            return
+
+        logger.info("Fetching details for %s articles", len(pmids))
+        logger.debug("PMIDs to fetch: %s", pmids)
+
+        missing = pmids
+        if self.cache is not None:
+            cached = self.cache.get_articles(pmids)
+            missing = [pmid for pmid in pmids if pmid not in cached]
+            logger.debug("%s articles cached, %s to fetch", len(cached), len(missing))
+            yield from cached.values()
+
+        if not missing:
+            return
+
+        batches = [
+            {"id": ",".join(missing[start : start + EFETCH_BATCH_SIZE])}
+            for start in range(0, len(missing), EFETCH_BATCH_SIZE)
+        ]
+        if len(batches) > 1:
+            # Each batch is cached as soon as it is parsed, including batches
+            # fetched ahead that the caller never gets to
+            fetch = self._efetch if self.cache is None else self._efetch_and_cache
+            yield from chain.from_iterable(self._iter_efetch_batches(batches, fetch))
+            return
+
+        if self.cache is None:
+            yield from self._iter_efetch(batches[0])
+            return
+
+        # Cache the articles parsed so far, even if the caller stops early
+        new_articles = []
+        try:
+            for article in self._iter_efetch(batches[0]):
+                new_articles.append(article)
+                yield article
+        finally:
+            self.cache.set_articles(new_articles)
+
+    def _efetch_batches(self, batches: List[dict]) -> List:
+        """
+        Run EFetch for several batches, overlapping their network round trips.
+
+        Args:
+            batches: EFetch parameters for each batch (see _efetch)
 
-        logger.info(f"Fetching details for {len(pmids)} articles")
-        logger.debug(f"PMIDs to fetch: {pmids}")
+        Returns:
+            List of dictionaries containing article details, in batch order
+        """
+        articles = []
+        for batch_articles in self._iter_efetch_batches(batches):
+            articles.extend(batch_articles)
+        return articles
 
-        # Apply rate limiting
-        self._rate_limit()
+    def _iter_efetch_batches(
+        self, batches: List[dict], fetch: Optional[Callable[[dict], List]] = None
+    ) -> Iterator[List]:
+        """
+        Yield the parsed articles of each EFetch batch, in batch order.
+
+        Up to MAX_CONCURRENT_REQUESTS batches are fetched and parsed ahead of the
+        one being consumed; the next batch is only requested once an earlier one
+        is handed over, so a consumer that stops early doesn't trigger the rest.
+        The rate limiter still spaces out when each request starts.
 
-        # Build the fetch URL
-        fetch_url = f"{self.base_url}/efetch.fcgi"
+        Args:
+            batches: EFetch parameters for each batch (see _efetch)
+            fetch: Function fetching one batch, run in a worker thread
+                (defaults to _efetch)
 
+        Yields:
+            List of dictionaries containing article details for one batch
+        """
+        fetch = fetch or self._efetch
+        if len(batches) == 1:
+            yield fetch(batches[0])
+            return
+
+        remaining = iter(batches)
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            pending = deque(
+                executor.submit(fetch, batch)
+                for batch in islice(remaining, MAX_CONCURRENT_REQUESTS)
+            )
+            try:
+                while pending:
+                    batch_articles = pending.popleft().result()
+                    next_batch = next(remaining, None)
+                    if next_batch is not None:
+                        pending.append(executor.submit(fetch, next_batch))
+                    yield batch_articles
+            finally:
+                # Don't start batches nobody will consume
+                for future in pending:
+                    future.cancel()
+
+    def _efetch(self, batch_params: dict) -> List:
+        """
+        Run a single EFetch request and parse the returned articles.
+
+        Args:
+            batch_params: Parameters selecting the articles, either "id" or
+                "WebEnv"/"query_key" with "retstart"/"retmax"
+
+        Returns:
+            List of dictionaries containing article details
+        """
+        return list(self._iter_efetch(batch_params))
+
+    def _efetch_and_cache(self, batch_params: dict) -> List:
+        """
+        Run a single EFetch request and store the parsed articles in the cache.
+
+        Args:
+            batch_params: Parameters selecting the articles (see _efetch)
+
+        Returns:
+            List of dictionaries containing article details
+        """
+        articles = self._efetch(batch_params)
+        self.cache.set_articles(articles)
+        return articles
+
+    def _iter_efetch(self, batch_params: dict) -> Iterator[dict]:
+        """
+        Run a single EFetch request, yielding articles as the response streams in.
+
+        Errors are logged and end the iteration early.
+
+        Args:
+            batch_params: Parameters selecting the articles (see _efetch)
+
+        Yields:
+            Dictionary containing article details
+        """
         # Parameters for fetching details
-        params = {
-            "db": "pubmed",
-            "id": ",".join(pmids),
-            "retmode": "xml",
-            "rettype": "abstract",
-            "email": self.email,
-        }
+        params = {**self._base_fetch_params, **batch_params}
 
         try:
-            logger.debug(f"Making request to: {fetch_url}")
-            response = requests.get(fetch_url, params=params)
-            response.raise_for_status()
+            with self._request_with_retry(
+                self._fetch_url, params, stream=True
+            ) as response:
+                # Parse the XML response as it streams in
+                yield from self._parse_efetch_response(
+                    response.iter_content(STREAM_CHUNK_SIZE)
+                )
 
-            # Parse the XML response
-            root = ET.fromstring(response.text)
+        except requests.RequestException as e:
+            logger.error("Error fetching article details: %s", e)
+        except etree.XMLSyntaxError as e:
+            logger.error("Error parsing XML response: %s", e)
+        except Exception as e:
+            logger.error("Unexpected error: %s", e)
+
+    def _parse_efetch_response(self, chunks: Iterable[bytes]) -> Iterator[dict]:
+        """
+        Parse an EFetch XML response into article dictionaries.
 
-            articles = []
-            for article_elem in root.findall(".//PubmedArticle"):
+        The response is parsed incrementally as chunks arrive, one PubmedArticle
+        at a time, and each article is freed once parsed so memory use doesn't
+        grow with the size of the response.
+
+        Args:
+            chunks: Pieces of the (decoded) EFetch response body
+
+        Yields:
+            Dictionary containing article details
+        """
+        parser = etree.XMLPullParser(events=("end",), tag="PubmedArticle")
+
+        def parse_ready_articles():
+            for _, article_elem in parser.read_events():
                 article_data = self._parse_article_xml(article_elem)
                 if article_data:
-                    articles.append(article_data)
+                    yield article_data
 
-            logger.info(f"Successfully parsed {len(articles)} articles")
-            return articles
+                # Free the parsed article and any finished siblings before it
+                article_elem.clear()
+                while article_elem.getprevious() is not None:
+                    del article_elem.getparent()[0]
 
-        except requests.RequestException as e:
-            if "429" in str(e):
-                logger.warning("Rate limit exceeded. Waiting 10 seconds...")
-                time.sleep(10)
-                return self.fetch_article_details(pmids)  # Retry once
-            else:
-                logger.error(f"Error fetching article details: {e}")
-                return []
-        except ET.ParseError as e:
-            logger.error(f"Error parsing XML response: {e}")
-            return []
-        except Exception as e:
-            logger.error(f"Unexpected error: {e}")
-            return []
+        for chunk in chunks:
+            parser.feed(chunk)
+            yield from parse_ready_articles()
+
+        parser.close()
+        yield from parse_ready_articles()
 
     def _parse_article_xml(self, article_elem) -> dict:
         """
         Parse a single article XML element into a dictionary.
 
+        The MedlineCitation subtree is traversed once, picking out the fields
+        of interest by tag as they are encountered.
+
         Args:
             article_elem: XML element containing article data
 
@@ -173,136 +599,94 @@ class PubMedClient:
         """
         try:
             # Get the basic citation info
-            citation = article_elem.find(".//MedlineCitation")
+            citation = article_elem.find("MedlineCitation")
             if citation is None:
                 logger.warning("No MedlineCitation found in article")
                 return None
 
-            # Extract PMID
-            pmid_elem = citation.find(".//PMID")
-            pmid = pmid_elem.text if pmid_elem is not None else "Unknown"
-
-            logger.debug(f"Parsing article with PMID: {pmid}")
-
-            # Extract article info
-            article = citation.find(".//Article")
-            if article is None:
-                logger.warning(f"No Article element found for PMID {pmid}")
+            if citation.find("Article") is None:
+                pmid = citation.findtext("PMID", "Unknown")
+                logger.warning("No Article element found for PMID %s", pmid)
                 return None
 
-            # Extract title - handle multiple possible locations
+            pmid = None
             title = ""
-            title_elem = article.find(".//ArticleTitle")
-            if title_elem is not None and title_elem.text:
-                title = title_elem.text.strip()
-            else:
-                logger.warning(f"No title found for PMID {pmid}")
+            abstract_parts = []
+            author_records = []
+            journals = {}
+            pub_date = None
+            author = None
+
+            # Local aliases for names used on every element
+            author_fields = _AUTHOR_FIELDS
+            new_author = _AUTHOR_TEMPLATE.copy
+            add_author = author_records.append
+            string_value = _XP_STRING
+
+            for elem in citation.iter(*_FIELD_TAGS):
+                tag = elem.tag
+
+                if tag in author_fields:
+                    if author is not None and elem.getparent().tag == "Author":
+                        author[author_fields[tag]] = (elem.text or "").strip()
+                elif tag == "Author":
+                    author = new_author()
+                    add_author(author)
+                elif tag == "AbstractText":
+                    # Skip translated abstracts under OtherAbstract
+                    if elem.getparent().tag == "Abstract":
+                        text = string_value(elem).strip()
+                        if text:
+                            # Handle structured abstracts with labels
+                            label = elem.get("Label", "")
+                            abstract_parts.append(f"{label}: {text}" if label else text)
+                elif tag == "PMID":
+                    # Later PMIDs belong to referenced articles
+                    if pmid is None:
+                        pmid = (elem.text or "").strip() or "Unknown"
+                elif tag == "ArticleTitle":
+                    if not title:
+                        title = string_value(elem).strip()
+                elif tag == "Year":
+                    # Only the issue's PubDate, not DateCompleted/DateRevised
+                    if pub_date is None and elem.getparent().tag == "PubDate":
+                        pub_date = (elem.text or "").strip() or None
+                elif tag not in journals:
+                    journals[tag] = (elem.text or "").strip()
+
+            pmid = pmid or "Unknown"
+            logger.debug("Parsing article with PMID: %s", pmid)
+
+            if not title:
+                logger.warning("No title found for PMID %s", pmid)
                 title = "No title available"
 
-            # Extract abstract - handle multiple AbstractText elements
-            abstract = ""
-            abstract_section = article.find(".//Abstract")
-            if abstract_section is not None:
-                abstract_texts = abstract_section.findall(".//AbstractText")
-                if abstract_texts:
-                    # Join multiple abstract sections
-                    abstract_parts = []
-                    for abs_text in abstract_texts:
-                        if abs_text.text:
-                            # Handle structured abstracts with labels
-                            label = abs_text.get("Label", "")
-                            text = abs_text.text.strip()
-                            if label:
-                                abstract_parts.append(f"{label}: {text}")
-                            else:
-                                abstract_parts.append(text)
-                    abstract = " ".join(abstract_parts)
-                else:
-                    logger.debug(f"No AbstractText found for PMID {pmid}")
-
-            # Extract authors with better error handling
+            abstract = " ".join(abstract_parts)
+            if not abstract_parts:
+                logger.debug("No AbstractText found for PMID %s", pmid)
+
+            # Only keep authors with at least a last name or a collective name
             authors = []
-            author_list = article.find(".//AuthorList")
-            if author_list is not None:
-                for author_elem in author_list.findall(".//Author"):
-                    try:
-                        last_name_elem = author_elem.find(".//LastName")
-                        first_name_elem = author_elem.find(".//ForeName")
-                        initials_elem = author_elem.find(".//Initials")
-
-                        # Handle different author formats
-                        last_name = (
-                            last_name_elem.text.strip()
-                            if last_name_elem is not None and last_name_elem.text
-                            else ""
-                        )
-                        first_name = (
-                            first_name_elem.text.strip()
-                            if first_name_elem is not None and first_name_elem.text
-                            else ""
-                        )
-                        initials = (
-                            initials_elem.text.strip()
-                            if initials_elem is not None and initials_elem.text
-                            else ""
-                        )
-
-                        # Only add author if we have at least a last name
-                        if last_name:
-                            authors.append(
-                                {
-                                    "last_name": last_name,
-                                    "first_name": first_name,
-                                    "initials": initials,
-                                }
-                            )
-                        else:
-                            # Handle collective names or other author formats
-                            collective_name = author_elem.find(".//CollectiveName")
-                            if collective_name is not None and collective_name.text:
-                                authors.append(
-                                    {
-                                        "last_name": collective_name.text.strip(),
-                                        "first_name": "",
-                                        "initials": "",
-                                    }
-                                )
-
-                    except Exception as e:
-                        logger.warning(
-                            f"Error parsing individual author for PMID {pmid}: {e}"
-                        )
-                        continue
-
-            # Extract journal with fallback options
-            journal = ""
-            # Try multiple journal title locations
-            journal_elem = article.find(".//Journal/Title")
-            if journal_elem is None:
-                journal_elem = article.find(".//Journal/ISOAbbreviation")
-            if journal_elem is None:
-                journal_elem = article.find(".//MedlineTA")
-
-            if journal_elem is not None and journal_elem.text:
-                journal = journal_elem.text.strip()
-            else:
-                logger.debug(f"No journal found for PMID {pmid}")
+            keep_author = authors.append
+            for author in author_records:
+                collective_name = author.pop("collective_name", "")
+                if author["last_name"]:
+                    keep_author(author)
+                elif collective_name:
+                    keep_author(
+                        {"last_name": collective_name, "first_name": "", "initials": ""}
+                    )
+
+            # Pick the journal name from the preferred location that has one
+            journal = next(
+                (journals[tag] for tag in _JOURNAL_TAGS if journals.get(tag)), ""
+            )
+            if not journal:
+                logger.debug("No journal found for PMID %s", pmid)
                 journal = "Unknown journal"
 
-            # Extract publication date with error handling
-            pub_date = None
-            try:
-                journal_issue = article.find(".//Journal/JournalIssue")
-                if journal_issue is not None:
-                    pub_date_elem = journal_issue.find(".//PubDate")
-                    if pub_date_elem is not None:
-                        year_elem = pub_date_elem.find(".//Year")
-                        if year_elem is not None and year_elem.text:
-                            pub_date = year_elem.text.strip()
-            except Exception as e:
-                logger.debug(f"Error parsing publication date for PMID {pmid}: {e}")
-
-            logger.debug(f"Successfully parsed article {pmid}: {title[:50]}...")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Successfully parsed article %s: %s...", pmid, title[:50])
 
             return {
                 "pmid": pmid,
@@ -314,15 +698,14 @@ class PubMedClient:
             }
 
         except Exception as e:
-            logger.error(f"Error parsing article XML: {e}")
+            logger.error("Error parsing article XML: %s", e)
             # Try to extract at least the PMID for debugging
             try:
-                pmid_elem = article_elem.find(".//PMID")
-                pmid = pmid_elem.text if pmid_elem is not None else "Unknown"
-                logger.error(f"Failed to parse article with PMID: {pmid}")
+                pmid = article_elem.findtext(".//PMID", "Unknown")
+                logger.error("Failed to parse article with PMID: %s", pmid)
             except (AttributeError, TypeError) as debug_error:
                 logger.error(
-                    f"Could not even extract PMID from failed article: {debug_error}"
+                    "Could not even extract PMID from failed article: %s", debug_error
                 )
             return None
 
@@ -330,6 +713,9 @@ class PubMedClient:
         """
         Search PubMed and fetch full article details in one step.
 
+        Articles are fetched through the NCBI history server, see
+        search_and_fetch_history.
+
         Args:
             query: Search query string
             max_results: Maximum number of results to return
@@ -337,17 +723,86 @@ class PubMedClient:
         Returns:
             List of dictionaries containing full article details
         """
-        logger.info(f"Starting search and fetch for: '{query}'")
+        logger.info("Starting search and fetch for: '%s'", query)
+
+        _, articles = self.search_and_fetch_history(query, max_results)
+        return articles
+
+    def search_and_fetch_history(
+        self, query: str, max_results: int = 10
+    ) -> Tuple[List[str], List]:
+        """
+        Search PubMed and fetch article details using the NCBI history server.
+
+        ESearch stores its results on the history server and EFetch reads them back
+        by WebEnv/query_key, so the PMID list is never sent back to NCBI. With a
+        cache the history server is bypassed so cached searches and articles are
+        reused.
+
+        Args:
+            query: Search query string
+            max_results: Maximum number of results to return
+
+        Returns:
+            Tuple of (list of PMIDs, list of dictionaries containing article details)
+        """
+        if self.cache is not None:
+            pmids = self.search_pubmed(query, max_results)
+            return pmids, self.fetch_article_details(pmids) if pmids else []
+
+        logger.info("Searching PubMed with history for: '%s'", query)
 
-        # First search for PMIDs
-        pmids = self.search_pubmed(query, max_results)
+        result = self._esearch(query, max_results, use_history=True)
+        if result is None:
+            return [], []
 
+        pmids = result.get("idlist", [])
         if not pmids:
             logger.warning("No PMIDs found, returning empty list")
-            return []
+            return [], []
+
+        web_env = result.get("webenv")
+        query_key = result.get("querykey")
+        if not web_env or not query_key:
+            logger.warning("ESearch returned no history, fetching by PMID instead")
+            return pmids, self.fetch_article_details(pmids)
+
+        logger.info("Fetching details for %s articles from history", len(pmids))
+        batches = [
+            {
+                "WebEnv": web_env,
+                "query_key": query_key,
+                "retstart": start,
+                "retmax": min(EFETCH_BATCH_SIZE, len(pmids) - start),
+            }
+            for start in range(0, len(pmids), EFETCH_BATCH_SIZE)
+        ]
+        articles = self._efetch_batches(batches)
 
-        # Then fetch full details
-        articles = self.fetch_article_details(pmids)
+        logger.info("Search and fetch completed. Retrieved %s articles", len(articles))
+        return pmids, articles
 
-        logger.info(f"Search and fetch completed. Retrieved {len(articles)} articles")
-        return articles
+    def search_and_fetch_many(
+        self, queries: List[str], max_results: int = 10
+    ) -> Tuple[List[str], List]:
+        """
+        Search PubMed for articles matching any of several queries at once.
+
+        The queries are combined into a single OR search, so all of them cost one
+        ESearch request, and the matches are fetched through the history server
+        (see search_and_fetch_history).
+
+        Args:
+            queries: Search query strings
+            max_results: Maximum number of results to return in total
+
+        Returns:
+            Tuple of (list of PMIDs, list of dictionaries containing article details)
+        """
+        queries = [query.strip() for query in queries if query.strip()]
+        if not queries:
+            logger.warning("No queries provided, returning empty list")
+            return [], []
+
+        combined_query = " OR ".join(f"({query})" for query in queries)
+        return self.search_and_fetch_history(combined_query, max_results)
@@ -2,8 +2,11 @@
 """
 Test fetching full article details from PubMed.
 """
+import pytest
+
 from src.biolitminer.data.pubmed_client import PubMedClient
 
+@pytest.mark.network
 def test_article_fetching():
     """Test fetching full article details."""
     client = PubMedClient(email="your.email@example.com")  # Replace with your email
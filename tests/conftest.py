@@ -0,0 +1,27 @@
+"""
+Shared pytest fixtures.
+"""
+
+import os
+
+import pytest
+import responses
+
+from src.biolitminer.data.pubmed_client import PubMedClient
+
+
+@pytest.fixture(scope="session")
+def client():
+    """PubMed client shared by the whole test session (and its connection pool)."""
+    with PubMedClient(
+        email="test@example.com", api_key=os.getenv("NCBI_API_KEY")
+    ) as client:
+        yield client
+
+
+@pytest.fixture
+def mocked_api(client, monkeypatch):
+    """Intercept the client's HTTP requests with `responses`, without rate limiting."""
+    monkeypatch.setattr(client, "min_delay", 0)
+    with responses.RequestsMock() as mock:
+        yield mock
@@ -0,0 +1,100 @@
+"""
+Tests for the on-disk PubMed cache.
+"""
+
+import time
+
+from src.biolitminer.data.cache import PubMedCache
+
+
+def _article(pmid):
+    return {
+        "pmid": pmid,
+        "title": f"Article {pmid}",
+        "abstract": "",
+        "authors": [{"last_name": "Smith", "first_name": "Jane", "initials": "J"}],
+        "journal": "Nature",
+        "publication_date": "2023",
+    }
+
+
+def test_articles_round_trip(tmp_path):
+    """Test that cached articles are returned by PMID."""
+    cache = PubMedCache(tmp_path / "cache.sqlite")
+    cache.set_articles([_article("1"), _article("2")])
+
+    assert cache.get_articles(["1", "2", "3"]) == {
+        "1": _article("1"),
+        "2": _article("2"),
+    }
+    cache.close()
+
+    # Persists across instances
+    cache = PubMedCache(tmp_path / "cache.sqlite")
+    assert cache.get_articles(["2"]) == {"2": _article("2")}
+    cache.close()
+
+
+def test_search_round_trip(tmp_path):
+    """Test that searches are keyed on the normalized query and max_results."""
+    cache = PubMedCache(tmp_path / "cache.sqlite")
+    cache.set_search("BRCA1  breast cancer", 10, ["1", "2"])
+
+    assert cache.get_search("BRCA1 breast cancer ", 10) == ["1", "2"]
+    assert cache.get_search("BRCA1 breast cancer", 20) is None
+    assert cache.get_search("BRCA2", 10) is None
+    cache.close()
+
+
+def test_recent_searches_are_kept_in_memory(tmp_path):
+    """Test that repeated searches are answered without going to SQLite."""
+    cache = PubMedCache(tmp_path / "cache.sqlite", memory_searches=1)
+    cache.set_search("BRCA1", 10, ["1"])
+    cache.set_search("TP53", 10, ["2"])
+    cache._conn.execute("DELETE FROM searches WHERE query = 'TP53'")
+
+    # Most recent search comes from memory, older ones were evicted to SQLite only
+    assert cache.get_search("TP53", 10) == ["2"]
+    assert cache.get_search("BRCA1", 10) == ["1"]
+    assert cache.get_search("TP53", 10) is None
+    cache.close()
+
+
+def test_in_memory_cache():
+    """Test that ":memory:" gives a cache that isn't written to disk."""
+    cache = PubMedCache(":memory:")
+    cache.set_articles([_article("1")])
+    cache.set_search("BRCA1", 10, ["1"])
+
+    assert cache.get_articles(["1"]) == {"1": _article("1")}
+    assert cache.get_search("BRCA1", 10) == ["1"]
+    cache.close()
+
+
+def test_expired_entries_are_ignored(tmp_path):
+    """Test that entries older than their expiry are treated as missing."""
+    cache = PubMedCache(
+        tmp_path / "cache.sqlite", article_expire_after=0.01, search_expire_after=0.01
+    )
+    cache.set_articles([_article("1")])
+    cache.set_search("COVID-19", 10, ["1"])
+    time.sleep(0.02)
+
+    assert cache.get_articles(["1"]) == {}
+    assert cache.get_search("COVID-19", 10) is None
+    cache.close()
+
+
+def test_least_recently_used_articles_are_evicted(tmp_path):
+    """Test that the cache keeps at most max_articles, dropping the least recent."""
+    cache = PubMedCache(tmp_path / "cache.sqlite", max_articles=2)
+    cache.set_articles([_article("1")])
+    time.sleep(0.01)
+    cache.set_articles([_article("2")])
+    time.sleep(0.01)
+    cache.get_articles(["1"])
+    time.sleep(0.01)
+    cache.set_articles([_article("3")])
+
+    assert sorted(cache.get_articles(["1", "2", "3"])) == ["1", "3"]
+    cache.close()
@@ -0,0 +1,43 @@
+"""
+Pytest tests for display formatting helpers.
+"""
+
+from src.biolitminer.core.formatting import format_author, format_author_names
+
+
+def test_format_author_full_name():
+    """Test formatting an author with a first name."""
+    author = {"last_name": "Smith", "first_name": "Jane", "initials": "J"}
+
+    assert format_author(author) == "Jane Smith"
+
+
+def test_format_author_initials_fallback():
+    """Test that initials are used when there is no first name."""
+    author = {"last_name": "Smith", "first_name": "", "initials": "J"}
+
+    assert format_author(author) == "J Smith"
+
+
+def test_format_author_collective_name():
+    """Test formatting a collective author name."""
+    author = {"last_name": "COVID-19 Study Group", "first_name": "", "initials": ""}
+
+    assert format_author(author) == "COVID-19 Study Group"
+
+
+def test_format_author_names_truncates():
+    """Test that long author lists end with et al."""
+    authors = [
+        {"last_name": "Smith", "first_name": "Jane", "initials": "J"},
+        {"last_name": "Doe", "first_name": "John", "initials": "J"},
+        {"last_name": "Roe", "first_name": "Rita", "initials": "R"},
+    ]
+
+    assert format_author_names(authors, 2) == "Jane Smith, John Doe, et al."
+    assert format_author_names(authors, 5) == "Jane Smith, John Doe, Rita Roe"
+
+
+def test_format_author_names_empty():
+    """Test formatting an empty author list."""
+    assert format_author_names([], 2) == ""
@@ -0,0 +1,73 @@
+"""
+Pytest tests for logging configuration.
+"""
+
+import logging
+import logging.handlers
+
+from src.biolitminer.core.logging_config import setup_logging
+
+
+def test_setup_logging_reuses_handlers():
+    """Test that a repeated call only updates the logging level."""
+    setup_logging(level="WARNING", log_to_console=True)
+    root = logging.getLogger()
+    handlers = list(root.handlers)
+
+    setup_logging(level="DEBUG", log_to_console=True)
+
+    assert root.handlers == handlers
+    assert root.level == logging.DEBUG
+    assert all(handler.level == logging.DEBUG for handler in root.handlers)
+
+
+def test_setup_logging_toggles_console_without_rebuilding():
+    """Test that switching console logging on and off keeps the same handlers."""
+    setup_logging(level="WARNING", log_to_console=False)
+    setup_logging(level="DEBUG", log_to_console=True)
+    root = logging.getLogger()
+    handlers = list(root.handlers)
+    assert len(handlers) == 1
+    assert isinstance(handlers[0], logging.StreamHandler)
+
+    # The dashboard makes this pair of calls on every rerun with verbose logging
+    for _ in range(3):
+        setup_logging(level="WARNING", log_to_console=False)
+        assert handlers[0].level > logging.CRITICAL
+
+        setup_logging(level="DEBUG", log_to_console=True)
+        assert handlers[0].level == logging.DEBUG
+
+    assert root.handlers == handlers
+
+
+def test_setup_logging_rebuilds_on_new_log_file(tmp_path):
+    """Test that changing the log file rebuilds the handlers."""
+    setup_logging(level="WARNING", log_to_console=True)
+    console_handler = logging.getLogger().handlers[0]
+
+    setup_logging(level="WARNING", log_file=str(tmp_path / "biolitminer.log"))
+    handlers = logging.getLogger().handlers
+
+    assert len(handlers) == 2
+    assert console_handler not in handlers
+    assert any(isinstance(h, logging.handlers.QueueHandler) for h in handlers)
+
+    setup_logging(level="WARNING", log_to_console=False)
+    assert logging.getLogger().handlers == []
+
+
+def test_setup_logging_file(tmp_path):
+    """Test logging to a file."""
+    log_file = tmp_path / "logs" / "biolitminer.log"
+    setup_logging(level="INFO", log_file=str(log_file), log_to_console=False)
+
+    logging.getLogger("biolitminer.test").info("Hello from the test")
+    logging.getLogger("biolitminer.test").debug("Below the logging level")
+
+    # Reconfiguring without a file flushes and stops the file writer
+    setup_logging(level="INFO", log_to_console=False)
+
+    contents = log_file.read_text()
+    assert "INFO - Hello from the test" in contents
+    assert "Below the logging level" not in contents
@@ -69,3 +69,22 @@ def test_article_string_representation():
     result = str(article)
     assert "pmid=12345" in result
     assert "This is a very long title that should be truncat" in result
+
+
+def test_models_use_slots():
+    """Test that model instances don't carry a per-instance __dict__."""
+    author = Author("Smith", "Jane", "J.")
+    article = Article("12345", "Test Article")
+
+    assert not hasattr(author, "__dict__")
+    assert not hasattr(article, "__dict__")
+
+
+def test_articles_do_not_share_authors():
+    """Test that each article gets its own author list."""
+    article1 = Article("1", "First")
+    article2 = Article("2", "Second")
+
+    article1.add_author(Author("Smith", "Jane"))
+
+    assert len(article2.authors) == 0
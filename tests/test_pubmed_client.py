@@ -2,46 +2,484 @@
 Pytest tests for PubMed client.
 """
 
-from src.biolitminer.data.pubmed_client import PubMedClient
+import time
+from io import BytesIO
+from pathlib import Path
+from urllib.parse import parse_qs
 
-# TODO: add mock responses for the tests
+import pytest
+import requests
+import responses
 
+from src.biolitminer.data import pubmed_client
+from src.biolitminer.data.pubmed_client import MAX_CONCURRENT_REQUESTS, PubMedClient
 
-def test_pubmed_client_creation():
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+ESEARCH_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
+EFETCH_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
+
+
+def _response(status_code, headers=None, content=b""):
+    """Build a requests.Response with the given status, headers and body."""
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response.raw = BytesIO(content)
+    return response
+
+
+def test_pubmed_client_creation(client):
     """Test creating a PubMed client."""
-    client = PubMedClient(email="test@example.com")
     assert client.email == "test@example.com"
     assert "eutils.ncbi.nlm.nih.gov" in client.base_url
 
 
-def test_pubmed_search_covid():
+def test_session_retries_failed_connections(client):
+    """Test that the session retries connection errors but not responses."""
+    retries = client.session.get_adapter("https://eutils.ncbi.nlm.nih.gov").max_retries
+
+    assert retries.connect == 3
+    assert retries.read == 0
+    assert retries.status == 0
+
+
+def test_api_key_raises_rate_limit(monkeypatch):
+    """Test that an API key is sent with requests and shortens the request delay."""
+    sent = []
+
+    def fake_post(url, data, **kwargs):
+        sent.append(data)
+        return _response(200, content=b'{"esearchresult": {"idlist": []}}')
+
+    with (
+        PubMedClient(email="test@example.com") as anonymous,
+        PubMedClient(email="test@example.com", api_key="secret") as client,
+    ):
+        assert client.min_delay < anonymous.min_delay
+
+        client.min_delay = 0
+        monkeypatch.setattr(client.session, "post", fake_post)
+        client.search_pubmed("BRCA1")
+
+    assert sent[0]["api_key"] == "secret"
+    assert sent[0]["tool"] == "biolitminer"
+    assert sent[0]["email"] == "test@example.com"
+
+
+def test_pubmed_client_context_manager(monkeypatch):
+    """Test that the client closes its session when used as a context manager."""
+    closed = []
+    with PubMedClient(email="test@example.com") as client:
+        assert client.session.headers["User-Agent"].startswith("biolitminer/")
+        monkeypatch.setattr(client.session, "close", lambda: closed.append(True))
+
+    assert closed == [True]
+
+
+def test_pubmed_search_covid(client, mocked_api):
     """Test searching for COVID-19 articles."""
-    client = PubMedClient(email="test@example.com")
+    mocked_api.add(
+        responses.POST,
+        ESEARCH_URL,
+        body=(FIXTURES_DIR / "esearch_covid.json").read_bytes(),
+        content_type="application/json",
+    )
     pmids = client.search_pubmed("COVID-19", max_results=3)
 
-    assert isinstance(pmids, list)
-    assert len(pmids) <= 3
-    assert len(pmids) > 0  # Should find some COVID articles
+    assert pmids == ["38012345", "37654321", "36000001"]
+    sent = parse_qs(mocked_api.calls[0].request.body)
+    assert sent["term"] == ["COVID-19"]
+    assert sent["retmode"] == ["json"]
 
-    # Check that PMIDs are strings and numeric
-    for pmid in pmids:
-        assert isinstance(pmid, str)
-        assert pmid.isdigit()
 
-
-def test_pubmed_search_empty_query():
+def test_pubmed_search_empty_query(client, mocked_api):
     """Test searching with empty query."""
-    client = PubMedClient(email="test@example.com")
+    mocked_api.add(
+        responses.POST,
+        ESEARCH_URL,
+        json={
+            "header": {"type": "esearch", "version": "0.3"},
+            "esearchresult": {"ERROR": "Empty term and query_key - nothing todo"},
+        },
+    )
     pmids = client.search_pubmed("", max_results=3)
 
     # Should return empty list for empty query
-    assert isinstance(pmids, list)
+    assert pmids == []
 
 
-def test_pubmed_search_max_results():
+def test_pubmed_search_max_results(client, mocked_api):
     """Test that max_results parameter works."""
-    client = PubMedClient(email="test@example.com")
+    mocked_api.add(
+        responses.POST,
+        ESEARCH_URL,
+        json={"esearchresult": {"count": "5", "retmax": "2", "idlist": ["1", "2"]}},
+    )
     pmids = client.search_pubmed("cancer", max_results=2)
 
-    assert isinstance(pmids, list)
-    assert len(pmids) <= 2
+    assert pmids == ["1", "2"]
+    assert parse_qs(mocked_api.calls[0].request.body)["retmax"] == ["2"]
+
+
+def test_search_and_fetch_over_http(client, mocked_api):
+    """Test a full search and fetch through the history server."""
+    mocked_api.add(
+        responses.POST,
+        ESEARCH_URL,
+        json={
+            "esearchresult": {
+                "count": "3",
+                "retmax": "3",
+                "querykey": "1",
+                "webenv": "MCID_123",
+                "idlist": ["38012345", "37654321", "36000001"],
+            }
+        },
+    )
+    mocked_api.add(
+        responses.POST,
+        EFETCH_URL,
+        body=(FIXTURES_DIR / "efetch_sample.xml").read_bytes(),
+        content_type="text/xml",
+    )
+    pmids, articles = client.search_and_fetch_history("COVID-19", max_results=3)
+
+    assert [article["pmid"] for article in articles] == pmids
+    assert articles[0]["journal"] == "Nature"
+    sent = parse_qs(mocked_api.calls[1].request.body)
+    assert sent["WebEnv"] == ["MCID_123"]
+    assert sent["query_key"] == ["1"]
+    assert "id" not in sent
+
+
+def test_fetch_article_details_batches(client, monkeypatch):
+    """Test that large PMID lists are split into EFetch batches."""
+    batches = []
+
+    def fake_efetch(batch_params):
+        batch = batch_params["id"].split(",")
+        batches.append(batch)
+        return [{"pmid": pmid} for pmid in batch]
+
+    monkeypatch.setattr(client, "_efetch", fake_efetch)
+    pmids = [str(i) for i in range(450)]
+    articles = client.fetch_article_details(pmids)
+
+    assert sorted(len(batch) for batch in batches) == [50, 200, 200]
+    assert [article["pmid"] for article in articles] == pmids
+
+
+def test_search_pubmed_extracts_ids(client, monkeypatch):
+    """Test that PMIDs are read from the idlist of the JSON ESearch response."""
+    sent = []
+
+    def fake_request(url, params, **kwargs):
+        sent.append(params)
+        return _response(
+            200,
+            content=(
+                b'{"header": {"type": "esearch", "version": "0.3"},'
+                b' "esearchresult": {"count": "2", "retmax": "2", "retstart": "0",'
+                b' "idlist": ["111", "222"], "translationset": []}}'
+            ),
+        )
+
+    monkeypatch.setattr(client, "_request_with_retry", fake_request)
+
+    pmids = client.search_pubmed("BRCA1", max_results=2)
+
+    assert pmids == ["111", "222"]
+    assert sent[0]["retmode"] == "json"
+
+
+def test_esearch_error_response(client, monkeypatch):
+    """Test that an ESearch error or invalid response gives no results."""
+    bodies = iter(
+        [
+            b'{"esearchresult": {"ERROR": "Empty term and query_key - nothing todo"}}',
+            b"<eSearchResult/>",
+        ]
+    )
+    monkeypatch.setattr(
+        client,
+        "_request_with_retry",
+        lambda *args, **kwargs: _response(200, content=next(bodies)),
+    )
+
+    assert client.search_pubmed("") == []
+    assert client.search_pubmed("BRCA1") == []
+
+
+def test_search_many(client, monkeypatch):
+    """Test that several queries are searched and returned in query order."""
+    results = {"BRCA1": ["111", "222"], "TP53": ["333"], "KRAS": []}
+
+    def fake_esearch(query, max_results, use_history=False):
+        return {"idlist": results[query]}
+
+    monkeypatch.setattr(client, "_esearch", fake_esearch)
+
+    found = client.search_many(["BRCA1", "TP53", "KRAS"], max_results=2)
+
+    assert found == results
+    assert list(found) == ["BRCA1", "TP53", "KRAS"]
+
+
+def test_search_and_fetch_history(client, monkeypatch):
+    """Test that articles are fetched by WebEnv/query_key instead of PMIDs."""
+    esearch_result = {
+        "count": "2",
+        "retmax": "2",
+        "querykey": "1",
+        "webenv": "MCID_123",
+        "idlist": ["111", "222"],
+    }
+    requests_made = []
+
+    def fake_efetch(batch_params):
+        requests_made.append(batch_params)
+        return [{"pmid": "111"}, {"pmid": "222"}]
+
+    monkeypatch.setattr(client, "_esearch", lambda *args, **kwargs: esearch_result)
+    monkeypatch.setattr(client, "_efetch", fake_efetch)
+    pmids, articles = client.search_and_fetch_history("BRCA1", max_results=2)
+
+    assert pmids == ["111", "222"]
+    assert len(articles) == 2
+    assert requests_made == [
+        {"WebEnv": "MCID_123", "query_key": "1", "retstart": 0, "retmax": 2}
+    ]
+
+
+def test_search_and_fetch_many_combines_queries(client, monkeypatch):
+    """Test that several queries are sent as one OR search."""
+    calls = []
+
+    def fake_history(query, max_results):
+        calls.append((query, max_results))
+        return ["111"], [{"pmid": "111"}]
+
+    monkeypatch.setattr(client, "search_and_fetch_history", fake_history)
+
+    pmids, articles = client.search_and_fetch_many(["BRCA1", " TP53 ", ""], 20)
+
+    assert pmids == ["111"]
+    assert calls == [("(BRCA1) OR (TP53)", 20)]
+    assert client.search_and_fetch_many([]) == ([], [])
+
+
+def test_search_and_fetch_uses_history(client, monkeypatch):
+    """Test that search_and_fetch goes through the history server."""
+    calls = []
+
+    def fake_history(query, max_results):
+        calls.append((query, max_results))
+        return ["111"], [{"pmid": "111"}]
+
+    monkeypatch.setattr(client, "search_and_fetch_history", fake_history)
+
+    assert client.search_and_fetch("BRCA1", max_results=5) == [{"pmid": "111"}]
+    assert calls == [("BRCA1", 5)]
+
+
+def test_efetch_batches_prefetch_is_bounded(client, monkeypatch):
+    """Test that batches are only requested a bounded distance ahead of the consumer."""
+    monkeypatch.setattr(client, "min_delay", 0)
+    requested = []
+
+    def fake_efetch(batch_params):
+        requested.append(batch_params["id"])
+        return [{"pmid": batch_params["id"]}]
+
+    monkeypatch.setattr(client, "_efetch", fake_efetch)
+    batches = [{"id": str(i)} for i in range(10)]
+
+    batch_iter = client._iter_efetch_batches(batches)
+    assert next(batch_iter) == [{"pmid": "0"}]
+    batch_iter.close()
+    assert len(requested) <= 1 + MAX_CONCURRENT_REQUESTS
+
+    articles = client._efetch_batches(batches)
+    assert [article["pmid"] for article in articles] == [str(i) for i in range(10)]
+
+
+def test_fetch_article_details_uses_cache(monkeypatch, tmp_path):
+    """Test that only PMIDs missing from the cache are fetched."""
+    requests_made = []
+
+    def fake_iter_efetch(batch_params):
+        requests_made.append(batch_params)
+        return iter([{"pmid": pmid} for pmid in batch_params["id"].split(",")])
+
+    cache_path = tmp_path / "c.sqlite"
+    with PubMedClient(email="test@example.com", cache_path=cache_path) as client:
+        monkeypatch.setattr(client, "_iter_efetch", fake_iter_efetch)
+        client.fetch_article_details(["111", "222"])
+        articles = client.fetch_article_details(["333", "222", "111"])
+
+    assert requests_made == [{"id": "111,222"}, {"id": "333"}]
+    assert [article["pmid"] for article in articles] == ["333", "222", "111"]
+
+
+def test_iter_article_details_caches_parsed_batches(monkeypatch):
+    """Test that parsed batches are cached even if the caller stops early."""
+    monkeypatch.setattr(
+        PubMedClient,
+        "_efetch",
+        lambda self, batch_params: [
+            {"pmid": pmid} for pmid in batch_params["id"].split(",")
+        ],
+    )
+    pmids = [str(i) for i in range(700)]
+
+    with PubMedClient(email="test@example.com", cache_path=":memory:") as client:
+        articles = client.iter_article_details(pmids)
+        next(articles)
+        articles.close()
+
+        # At least the whole first batch, not just the article handed over
+        assert len(client.cache.get_articles(pmids)) >= pubmed_client.EFETCH_BATCH_SIZE
+
+
+def test_iter_article_details_streams_response(client, monkeypatch):
+    """Test that articles are yielded while the EFetch response is being read."""
+    data = (FIXTURES_DIR / "efetch_sample.xml").read_bytes()
+    source = BytesIO(data)
+    response = _response(200)
+    response.raw = source
+    monkeypatch.setattr(client, "_request_with_retry", lambda *args, **kwargs: response)
+    monkeypatch.setattr(pubmed_client, "STREAM_CHUNK_SIZE", 1024)
+
+    articles = client.iter_article_details(["38012345", "37654321", "36000001"])
+    first = next(articles)
+
+    assert first["pmid"] == "38012345"
+    assert source.tell() < len(data)
+    assert [article["pmid"] for article in articles] == ["37654321", "36000001"]
+
+
+def test_request_with_retry_backs_off(client, monkeypatch):
+    """Test that 429/5xx responses are retried, honoring Retry-After."""
+    monkeypatch.setattr(client, "min_delay", 0)
+    replies = iter(
+        [
+            _response(429, {"Retry-After": "2"}),
+            _response(503),
+            _response(200, content=b'{"esearchresult": {"idlist": []}}'),
+        ]
+    )
+    sleeps = []
+    monkeypatch.setattr(client.session, "post", lambda *args, **kwargs: next(replies))
+    monkeypatch.setattr(pubmed_client.time, "sleep", sleeps.append)
+
+    response = client._request_with_retry("https://example.com", {})
+
+    assert response.status_code == 200
+    assert sleeps[0] == 2
+    assert 1 <= sleeps[1] <= 1.5
+
+
+def test_request_with_retry_gives_up(monkeypatch):
+    """Test that the last error response is raised after max_attempts attempts."""
+    calls = []
+
+    def fake_post(*args, **kwargs):
+        calls.append(_response(500))
+        return calls[-1]
+
+    monkeypatch.setattr(pubmed_client.time, "sleep", lambda seconds: None)
+
+    with PubMedClient(email="test@example.com", max_attempts=2) as client:
+        client.min_delay = 0
+        monkeypatch.setattr(client.session, "post", fake_post)
+
+        with pytest.raises(requests.HTTPError):
+            client._request_with_retry("https://example.com", {}, stream=True)
+        assert len(calls) == 2
+        # Every failed response is closed, including the one that is raised
+        assert all(response.raw.closed for response in calls)
+
+        # Callers log the error and return an empty result
+        assert client.search_pubmed("BRCA1") == []
+
+
+@pytest.mark.parametrize("max_attempts", [0, -1])
+def test_max_attempts_must_be_positive(max_attempts):
+    """Test that a client can't be created without at least one attempt."""
+    with pytest.raises(ValueError, match="max_attempts"):
+        PubMedClient(email="test@example.com", max_attempts=max_attempts)
+
+
+def test_rate_limit_spaces_concurrent_requests(client, monkeypatch):
+    """Test that concurrent batches still respect the minimum request delay."""
+    monkeypatch.setattr(client, "min_delay", 0.05)
+    start_times = []
+
+    def fake_efetch(batch_params):
+        client._rate_limit()
+        start_times.append(time.monotonic())
+        return []
+
+    monkeypatch.setattr(client, "_efetch", fake_efetch)
+    client.fetch_article_details([str(i) for i in range(600)])
+
+    start_times.sort()
+    gaps = [later - earlier for earlier, later in zip(start_times, start_times[1:])]
+    assert len(start_times) == 3
+    assert all(gap >= 0.04 for gap in gaps)
+
+
+def test_rate_limit_is_shared_between_clients():
+    """Test that separate client instances don't each get their own rate limit."""
+    with (
+        PubMedClient(email="test@example.com") as first,
+        PubMedClient(email="test@example.com") as second,
+    ):
+        first.min_delay = second.min_delay = 0.05
+
+        start = time.monotonic()
+        first._rate_limit()
+        second._rate_limit()
+        first._rate_limit()
+
+    assert time.monotonic() - start >= 0.09
+
+
+def test_parse_efetch_response(client):
+    """Test parsing a saved EFetch response fed in small chunks."""
+    data = (FIXTURES_DIR / "efetch_sample.xml").read_bytes()
+    chunks = [data[start : start + 100] for start in range(0, len(data), 100)]
+    articles = list(client._parse_efetch_response(chunks))
+
+    assert [article["pmid"] for article in articles] == [
+        "38012345",
+        "37654321",
+        "36000001",
+    ]
+
+    article = articles[0]
+    assert article["title"] == "BRCA1 loss drives genomic instability in breast cancer."
+    assert article["abstract"] == (
+        "BACKGROUND: BRCA1 is a tumor suppressor. "
+        "RESULTS: Loss of BRCA1 increased instability."
+    )
+    assert article["authors"] == [
+        {"last_name": "Smith", "first_name": "Jane A", "initials": "JA"},
+        {"last_name": "Doe", "first_name": "", "initials": "J"},
+        {
+            "last_name": "Breast Cancer Genomics Consortium",
+            "first_name": "",
+            "initials": "",
+        },
+    ]
+    assert article["journal"] == "Nature"
+    assert article["publication_date"] == "2023"
+
+    # Falls back to the ISO abbreviation and has no PubDate/Year
+    assert articles[1]["journal"] == "J Comput Biol"
+    assert articles[1]["publication_date"] is None
+    assert articles[2]["abstract"] == ""
+    assert articles[2]["authors"] == []
+    # Only has the MedlineTA from MedlineJournalInfo
+    assert articles[2]["journal"] == "Cell Rep"
@@ -0,0 +1,60 @@
+"""
+Pytest tests for JSON serialization helpers.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.biolitminer.core.serialization import dump, dumps, loads
+
+
+def test_dumps_returns_bytes():
+    """Test that serialized output is UTF-8 encoded bytes."""
+    result = dumps({"pmid": "12345", "title": "Test Article"})
+
+    assert isinstance(result, bytes)
+    assert json.loads(result) == {"pmid": "12345", "title": "Test Article"}
+
+
+def test_dumps_non_serializable_values():
+    """Test that unsupported values are converted to strings."""
+    result = json.loads(dumps({"output": Path("results.json")}))
+
+    assert result["output"] == "results.json"
+
+
+def test_dumps_nested_articles():
+    """Test serializing articles with nested authors."""
+    articles = [
+        {
+            "pmid": "12345",
+            "authors": [{"last_name": "Smith", "first_name": "Jane"}],
+            "publication_date": "2024",
+        }
+    ]
+
+    assert json.loads(dumps(articles)) == articles
+
+
+def test_dump_writes_file(tmp_path):
+    """Test writing JSON directly to a file."""
+    output = tmp_path / "results.json"
+    dump([{"pmid": "12345"}], output)
+
+    assert json.loads(output.read_bytes()) == [{"pmid": "12345"}]
+
+
+def test_loads_round_trip():
+    """Test that loads accepts both bytes and str."""
+    articles = [{"pmid": "12345", "authors": []}]
+
+    assert loads(dumps(articles)) == articles
+    assert loads('{"idlist": ["1", "2"]}') == {"idlist": ["1", "2"]}
+
+
+def test_loads_invalid_json():
+    """Test that invalid JSON raises ValueError."""
+    with pytest.raises(ValueError):
+        loads(b"<eSearchResult/>")
@@ -0,0 +1,25 @@
+"""
+Pytest tests for version management.
+"""
+
+import re
+
+from src.biolitminer.core.version import get_version
+
+
+def test_get_version_from_pyproject():
+    """Test that the version is read from pyproject.toml."""
+    version = get_version()
+
+    assert version != "unknown"
+    assert re.fullmatch(r"\d+\.\d+\.\d+", version)
+
+
+def test_get_version_is_cached():
+    """Test that repeated calls don't re-read pyproject.toml."""
+    get_version.cache_clear()
+    get_version()
+    get_version()
+
+    assert get_version.cache_info().hits == 1
+    assert get_version.cache_info().misses == 1